@@ -69,3 +69,33 @@ async def test_asgi_dispatch_websocket(benchmark):
         await benchmark(combined, scope, receive, send)
     except Exception:
         pass
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_asgi_dispatch_fastapi_with_timeout(benchmark):
+    """Benchmark ASGI dispatch to FastAPI with a per-call timeout configured."""
+    fastapi_app = AsyncMock()
+    combined = asyncplus(fastapi_app, AsyncMock(), timeout=30.0)
+
+    scope = {"type": "http", "path": "/"}
+    receive = AsyncMock(return_value={"type": "http.request", "body": b""})
+    send = AsyncMock()
+
+    await benchmark(combined, scope, receive, send)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_asgi_dispatch_socketio_with_fallback(benchmark):
+    """Benchmark ASGI dispatch to Socket.IO with fallback enabled (happy path)."""
+    sio_app = AsyncMock()
+    combined = asyncplus(
+        AsyncMock(), sio_app, socketio_fallback_on_error=True
+    )
+
+    scope = {"type": "http", "path": "/socket.io/"}
+    receive = AsyncMock(return_value={"type": "http.disconnect"})
+    send = AsyncMock()
+
+    await benchmark(combined, scope, receive, send)
@@ -21,13 +21,19 @@ Designed around functional principles:
 - Pure core: routing decision is a pure, total function (same scope → same route).
 - Isolated effects: I/O (ASGI call) happens only at the boundary in one place.
 - Immutable: scope and captured values are never mutated.
-- Composition: asyncutilsx composes _to_asgi_app and a closure over _route + dispatch.
+- Composition: asyncutilsx composes _to_asgi_app and a dispatch closure built once per app;
+  the Socket.IO base path and its trailing-slash form are computed at build time, not per request.
 """
 
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
 import asyncio
 import logging
+import re
+import sys
+import time
 from typing import Literal, Protocol, overload
+from weakref import WeakValueDictionary
 
 from asgiref.typing import (
     ASGI3Application,
@@ -40,12 +46,29 @@ from socketio.asgi import ASGIApp
 from socketio.async_server import AsyncServer
 
 __version__ = "0.2.0"
-__all__ = ["asyncplus", "create_app", "router", "DebugHook", "health_check_route"]
+__all__ = [
+    "asyncplus",
+    "create_app",
+    "router",
+    "DebugHook",
+    "health_check_route",
+    "path_equals",
+    "path_prefix",
+]
 
 # Type for routing decision only. Keeps invalid routes unrepresentable.
 # Literal type (no class), so __slots__ does not apply.
 Route = Literal["socketio", "fastapi"]
 _logger = logging.getLogger(__name__)
+_DEFAULT_SOCKETIO_PATH = "/socket.io/"
+# Control characters (ASCII < 32, including tab) and space.
+_INVALID_SOCKETIO_PATH_CHARS = re.compile(r"[\x00-\x20]")
+# ASGIApp wrappers by id(AsyncServer). Values are weak, so a wrapper is cached only while a
+# composed app still holds it; a live wrapper references its server, so the id cannot be reused.
+# (Weak keys would never expire: each wrapper keeps its server alive.)
+_ASGI_APP_CACHE: WeakValueDictionary[int, ASGIApp] = WeakValueDictionary()
+# Scope types routed by path; every other string type (e.g. "lifespan") goes to FastAPI.
+_PATH_ROUTED_SCOPE_TYPES = frozenset(("http", "websocket"))
 
 
 class DebugHook(Protocol):
@@ -62,51 +85,207 @@ class DebugHook(Protocol):
         ...
 
 
+class _PathPredicate:
+    """
+    Route predicate matching the scope path against a literal, built by `path_equals` / `path_prefix`.
+    
+    Carrying the literal lets `router()` bucket these predicates by path instead of calling each one.
+    """
+
+    __slots__ = ("path", "prefix")
+
+    def __init__(self, path: str, prefix: bool) -> None:
+        self.path = path
+        self.prefix = prefix
+
+    def __call__(self, scope: Scope) -> bool:
+        """
+        Return whether the scope's "path" equals (or, for a prefix predicate, starts with) the literal.
+        
+        A missing or non-string path never matches.
+        """
+        path = scope.get("path")
+        if not isinstance(path, str):
+            return False
+        if self.prefix:
+            return path.startswith(self.path)
+        return path == self.path
+
+    def __repr__(self) -> str:
+        kind = "path_prefix" if self.prefix else "path_equals"
+        return f"{kind}({self.path!r})"
+
+
+def path_equals(path: str) -> Callable[[Scope], bool]:
+    """
+    Build a `router()` predicate that matches scopes whose "path" equals `path` exactly.
+    
+    Parameters:
+        path (str): Literal request path, e.g. "/health".
+    
+    Returns:
+        Callable[[Scope], bool]: Predicate that `router()` can look up by path instead of calling per request.
+    """
+    return _PathPredicate(path, prefix=False)
+
+
+def path_prefix(prefix: str) -> Callable[[Scope], bool]:
+    """
+    Build a `router()` predicate that matches scopes whose "path" starts with `prefix`.
+    
+    Parameters:
+        prefix (str): Literal path prefix, e.g. "/sse/".
+    
+    Returns:
+        Callable[[Scope], bool]: Predicate that `router()` can look up by path instead of calling per request.
+    """
+    return _PathPredicate(prefix, prefix=True)
+
+
+def _path_bucket_key(predicate: Callable[[Scope], bool]) -> str | None:
+    """
+    Return the path bucket for a `path_equals` / `path_prefix` predicate, or None if it must be called.
+    
+    The key is the first two characters of the literal (e.g. "/h" for "/health"); every path the predicate
+    can match shares them. Shorter literals such as a bare "/" prefix match too broadly to bucket.
+    """
+    if type(predicate) is not _PathPredicate or len(predicate.path) < 2:
+        return None
+    return predicate.path[:2]
+
+
 def router(
     routes: Sequence[tuple[Callable[[Scope], bool], ASGI3Application]],
     default_app: ASGI3Application | None = None,
+    *,
+    type_routes: Mapping[str, ASGI3Application] | None = None,
 ) -> ASGI3Application:
     """
     Builds an ASGI application that dispatches each incoming scope to the first app whose predicate returns true.
     
+    Predicates built with `path_equals` / `path_prefix` are grouped by the first two characters of their
+    path, so a request only evaluates the path predicates that could match it (plus any other predicates,
+    in their original order). First-match-wins ordering is preserved.
+    
+    `routes` and `type_routes` are read once, when the app is built; changing them afterwards has no effect.
+    
     Parameters:
         routes (Sequence[tuple[Callable[[Scope], bool], ASGI3Application]]): Sequence of (predicate, app) pairs where each predicate is called with the ASGI scope and, if it returns `True`, its corresponding app will handle the request.
         default_app (ASGI3Application | None): Optional application to call when no predicate matches; if `None` and no predicates match, a RuntimeError is raised.
+        type_routes (Mapping[str, ASGI3Application] | None): Optional apps keyed by scope "type" (e.g. `{"websocket": ws_app}`). Checked with one dict lookup before any predicate; scopes whose type is not listed fall through to `routes`.
     
     Returns:
         ASGI3Application: An ASGI application callable that routes incoming requests according to the provided predicates.
+        With no routes at all, `default_app` itself is returned, since every request would go to it; scopes then
+        reach it without the dict check.
     """
+    if not routes and not type_routes and default_app is not None:
+        return default_app
+    entries = [
+        (_path_bucket_key(predicate), predicate, route_app)
+        for predicate, route_app in routes
+    ]
+    # Routes to try when the path selects no bucket: every predicate that is not bucketed.
+    unkeyed = tuple(
+        (predicate, route_app)
+        for key, predicate, route_app in entries
+        if key is None
+    )
+    buckets = {
+        bucket: tuple(
+            (predicate, route_app)
+            for key, predicate, route_app in entries
+            if key is None or key == bucket
+        )
+        for bucket in {key for key, _, _ in entries if key is not None}
+    }
+
+    if not buckets:
+
+        async def app(
+            scope: Scope,
+            receive: ASGIReceiveCallable,
+            send: ASGISendCallable,
+        ) -> None:
+            """
+            Dispatches an incoming ASGI request to the first matching route application or to a default application.
+            
+            Parameters:
+                scope (Scope): The ASGI connection scope for the request.
+                receive (ASGIReceiveCallable): Callable to receive ASGI events from the server.
+                send (ASGISendCallable): Callable to send ASGI events to the server.
+            
+            Raises:
+                TypeError: If `scope` is not a dict.
+                RuntimeError: If no predicate matches the scope and no default application is provided.
+            """
+            if type(scope) is not dict:
+                _require_dict_scope(scope)
+            for predicate, route_app in unkeyed:
+                if predicate(scope):
+                    await route_app(scope, receive, send)
+                    return
+            if default_app is None:
+                raise RuntimeError("No matching route and no default app")
+            await default_app(scope, receive, send)
 
-    async def app(
+    else:
+
+        async def app(
+            scope: Scope,
+            receive: ASGIReceiveCallable,
+            send: ASGISendCallable,
+        ) -> None:
+            """
+            Dispatch like the plain variant, trying only the routes in the scope path's bucket.
+            
+            Raises:
+                TypeError: If `scope` is not a dict.
+                RuntimeError: If no predicate matches the scope and no default application is provided.
+            """
+            if type(scope) is not dict:
+                _require_dict_scope(scope)
+            path = scope.get("path")
+            candidates = (
+                buckets.get(path[:2], unkeyed)
+                if isinstance(path, str)
+                else unkeyed
+            )
+            for predicate, route_app in candidates:
+                if predicate(scope):
+                    await route_app(scope, receive, send)
+                    return
+            if default_app is None:
+                raise RuntimeError("No matching route and no default app")
+            await default_app(scope, receive, send)
+
+    if not type_routes:
+        return app
+
+    by_type = dict(type_routes)
+    predicate_app = app
+
+    async def typed_app(
         scope: Scope,
         receive: ASGIReceiveCallable,
         send: ASGISendCallable,
     ) -> None:
         """
-        Dispatches an incoming ASGI request to the first matching route application or to a default application.
-        
-        Parameters:
-            scope (Scope): The ASGI connection scope for the request.
-            receive (ASGIReceiveCallable): Callable to receive ASGI events from the server.
-            send (ASGISendCallable): Callable to send ASGI events to the server.
+        Dispatch to the app registered for the scope's "type", or to the predicate routes if none is.
         
         Raises:
             TypeError: If `scope` is not a dict.
-            RuntimeError: If no predicate matches the scope and no default application is provided.
+            RuntimeError: If no route matches the scope and no default application is provided.
         """
-        if not isinstance(scope, dict):
-            raise TypeError(
-                f"ASGI scope must be dict, got {type(scope).__name__}"
-            )
-        for predicate, route_app in routes:
-            if predicate(scope):
-                await route_app(scope, receive, send)
-                return
-        if default_app is None:
-            raise RuntimeError("No matching route and no default app")
-        await default_app(scope, receive, send)
+        if type(scope) is not dict:
+            _require_dict_scope(scope)
+        try:
+            route_app = by_type.get(scope.get("type"), predicate_app)
+        except TypeError:  # unhashable "type" value
+            route_app = predicate_app
+        await route_app(scope, receive, send)
 
-    return app
+    return typed_app
 
 
 def create_app(
@@ -146,19 +325,20 @@ def health_check_route() -> (
         """
         Responds to an HTTP request with a plain-text "OK" body.
         
-        Sends an HTTP 200 response with header `Content-Type: text/plain` and the body "OK".
+        Sends an HTTP 200 response with headers `Content-Type: text/plain` and `Content-Length: 2` and the body "OK".
         """
+        # Fresh message dicts per call: ASGI middleware may mutate sent messages in place.
         await send({
             "type": "http.response.start",
             "status": 200,
-            "headers": [[b"content-type", b"text/plain"]],
+            "headers": [[b"content-type", b"text/plain"], [b"content-length", b"2"]],
         })
         await send({
             "type": "http.response.body",
             "body": b"OK",
         })
 
-    return (lambda s: s.get("path") == "/health", health_app)
+    return (path_equals("/health"), health_app)
 
 
 def _to_asgi_app(socketio_app: AsyncServer | ASGIApp) -> ASGIApp:
@@ -169,13 +349,36 @@ def _to_asgi_app(socketio_app: AsyncServer | ASGIApp) -> ASGIApp:
         socketio_app (AsyncServer | ASGIApp): A Socket.IO AsyncServer instance or an ASGI application.
     
     Returns:
-        ASGIApp: An ASGI application. If given an AsyncServer, returns an ASGIApp wrapper around it; otherwise returns the input unchanged.
+        ASGIApp: An ASGI application. If given an AsyncServer, returns an ASGIApp wrapper around it (reused while an
+        earlier wrapper for the same server is still alive); otherwise returns the input unchanged.
     """
     if isinstance(socketio_app, AsyncServer):
-        return ASGIApp(socketio_app)
+        key = id(socketio_app)
+        asgi_app = _ASGI_APP_CACHE.get(key)
+        if asgi_app is None:
+            asgi_app = ASGIApp(socketio_app)
+            _ASGI_APP_CACHE[key] = asgi_app
+        return asgi_app
     return socketio_app
 
 
+def _require_dict_scope(scope: object) -> None:
+    """
+    Raise TypeError unless `scope` is a dict, as the ASGI spec requires.
+    
+    Called off the hot path: by `asyncplus` apps only after routing raised TypeError (e.g.
+    subscripting None or a list), so a non-dict mapping is routed there rather than rejected; and
+    by `router()` apps only when `type(scope) is not dict`.
+    
+    Raises:
+        TypeError: If `scope` is not a dict.
+    """
+    if not isinstance(scope, dict):
+        raise TypeError(
+            f"ASGI scope must be dict, got {type(scope).__name__}"
+        ) from None
+
+
 def _validate_socketio_path(socketio_path: str) -> None:
     """
     Validate a Socket.IO mount path and raise if it contains disallowed characters.
@@ -195,8 +398,7 @@ def _validate_socketio_path(socketio_path: str) -> None:
             "socketio_path cannot be '/' as it would match all paths. "
             f"Use a specific path like '/socket.io' (got: {socketio_path!r})"
         )
-    invalid_chars = [c for c in socketio_path if ord(c) < 32 or c in (" ", "\t")]
-    if invalid_chars:
+    if _INVALID_SOCKETIO_PATH_CHARS.search(socketio_path):
         raise ValueError(
             "socketio_path contains invalid characters. "
             f"Use a simple path like '/socket.io' (got: {socketio_path!r})"
@@ -207,7 +409,7 @@ def _normalize_socketio_path(socketio_path: str) -> str:
     """
     Normalize a Socket.IO mount path into a safe, absolute ASGI path.
     
-    Validates the provided path, then returns a normalized value:
+    Validates the provided path (the default path is known valid and returned as-is), then returns a normalized value:
     - If empty, returns "/socket.io/".
     - If missing a leading "/", prepends one.
     - Otherwise returns the path unchanged.
@@ -221,68 +423,155 @@ def _normalize_socketio_path(socketio_path: str) -> str:
     Raises:
         ValueError: If `socketio_path` contains disallowed characters.
     """
+    if socketio_path is _DEFAULT_SOCKETIO_PATH:
+        return socketio_path
     _validate_socketio_path(socketio_path)
     if not socketio_path:
-        return "/socket.io/"
+        return _DEFAULT_SOCKETIO_PATH
     if not socketio_path.startswith("/"):
         return f"/{socketio_path}"
     return socketio_path
 
 
-def _matches_socketio_path(path: str, socketio_path: str) -> bool:
-    # Match /path, /path/, /path/...; empty socketio_path -> "/" only.
-    # socketio_path is pre-normalized (leading slash) by _normalize_socketio_path.
+@lru_cache(maxsize=32)
+def _socketio_path_bounds(socketio_path: str) -> tuple[str, str]:
     """
-    Determine whether a request path targets the configured Socket.IO path or any of its subpaths.
+    Compute the base path and its trailing-slash form used to match Socket.IO requests.
     
     Parameters:
-        path (str): The incoming request path (e.g., "/socket.io/", "/socket.io/123").
-        socketio_path (str): The configured Socket.IO path, expected to be normalized with a leading
-            "/" (an empty value is treated as the root "/").
+        socketio_path (str): The configured Socket.IO path, expected to be normalized with a leading "/".
     
     Returns:
-        bool: `True` if `path` exactly equals the normalized base socketio path or starts with the
-        base followed by "/", `False` otherwise.
+        tuple[str, str]: `(base, base_slash)`, e.g. `("/socket.io", "/socket.io/")`. A path that strips to
+        nothing (which `_validate_socketio_path` rejects) yields `("/", "//")`.
     """
-    base = socketio_path.rstrip("/")
-    if not base:
-        # This should not happen as "/" is rejected in _validate_socketio_path
-        # Empty socketio_path is normalized to "/socket.io/" by _normalize_socketio_path
-        base = "/"
-    return path == base or path.startswith(f"{base}/")
+    base = socketio_path.rstrip("/") or "/"
+    # Interned so a scope path that is the same object hits str.__eq__'s identity shortcut.
+    return sys.intern(base), sys.intern(f"{base}/")
+
+
+@lru_cache(maxsize=32)
+def _make_router(socketio_path: str) -> Callable[[Scope], Route]:
+    """
+    Build a routing function specialised for one Socket.IO base path.
+    
+    The base path and its trailing-slash form (see `_socketio_path_bounds`) are captured by the
+    returned closure, so routing a request does no string building. Results are cached per
+    path, so repeated calls with the same path return the same function.
+    
+    Parameters:
+        socketio_path (str): Configured Socket.IO base path, expected to be normalized with a
+            leading "/".
+    
+    Returns:
+        Callable[[Scope], Route]: A pure function mapping an ASGI scope to its Route.
+    """
+    base, base_slash = _socketio_path_bounds(socketio_path)
+    base_len = len(base)
+
+    def route(scope: Scope) -> Route:
+        """
+        Select which application ("socketio" or "fastapi") should handle the given ASGI scope.
+        
+        Determination:
+        - If scope.type is "websocket" or "http" and the request path matches the base path -> routes to socketio.
+        - Otherwise (including "lifespan") -> routes to fastapi.
+        
+        A missing or non-string type is treated as "http"; a missing or non-string path never matches.
+        """
+        try:
+            scope_type = scope["type"]
+        except KeyError:
+            scope_type = "http"
+        try:
+            routed_by_path = scope_type in _PATH_ROUTED_SCOPE_TYPES
+        except TypeError:  # unhashable, so not a string: treated as "http"
+            routed_by_path = True
+        if routed_by_path or not isinstance(scope_type, str):
+            try:
+                path = scope["path"]
+            except KeyError:
+                return "fastapi"
+            # Servers send plain str paths, so the identity test settles it; isinstance only
+            # runs for other values (str subclasses still match). Paths no longer than the base
+            # can only match it exactly; the int compare skips startswith for "/" or "/docs".
+            if (type(path) is str or isinstance(path, str)) and (
+                path.startswith(base_slash) if len(path) > base_len else path == base
+            ):
+                return "socketio"
+        return "fastapi"
+
+    return route
 
 
 def _route(scope: Scope, socketio_path: str) -> Route:
     """
     Selects which application ("socketio" or "fastapi") should handle the given ASGI scope.
     
-    Determination:
-    - If scope.type is "lifespan" -> routes to fastapi.
-    - If scope.type is "websocket" and the request path matches socketio_path -> routes to socketio.
-    - If scope.type is "http" and the request path matches socketio_path -> routes to socketio.
-    - Otherwise -> routes to fastapi.
+    Thin wrapper over the cached router built by `_make_router`; `asyncplus` binds that router
+    once instead of calling this per request.
     
     Parameters:
         scope (Scope): ASGI scope dictionary; missing or non-string fields are treated as absent.
-        socketio_path (str): Configured Socket.IO base path used to decide http routing.
+        socketio_path (str): Configured Socket.IO base path used to decide routing.
     
     Returns:
         Route: `"socketio"` when the scope targets the Socket.IO application, `"fastapi"` otherwise.
     """
-    raw_type = scope.get("type", "http")
-    raw_path = scope.get("path", "")  # optional in ASGI for non-http/websocket
-    scope_type = raw_type if isinstance(raw_type, str) else "http"
-    path = raw_path if isinstance(raw_path, str) else ""
-    if scope_type == "lifespan":
-        return "fastapi"
-    if scope_type == "websocket":
-        # Gate websocket routing by path matching, same as HTTP
-        if _matches_socketio_path(path, socketio_path):
-            return "socketio"
-        return "fastapi"
-    if scope_type == "http" and _matches_socketio_path(path, socketio_path):
-        return "socketio"
-    return "fastapi"
+    return _make_router(socketio_path)(scope)
+
+
+def _with_debug_hook(
+    route_scope: Callable[[Scope], Route],
+    debug_hook: DebugHook,
+) -> Callable[[Scope], Route]:
+    """
+    Wrap a routing function so each decision is reported to `debug_hook` before it is returned.
+    
+    Parameters:
+        route_scope (Callable[[Scope], Route]): Routing function built by `_make_router`.
+        debug_hook (DebugHook): Callback invoked with the chosen route and the scope.
+    
+    Returns:
+        Callable[[Scope], Route]: Routing function with the same results as `route_scope`.
+    """
+
+    def route(scope: Scope) -> Route:
+        selected = route_scope(scope)
+        debug_hook(selected, scope)
+        return selected
+
+    return route
+
+
+async def _call_with_timeout(
+    app: ASGI3Application,
+    scope: Scope,
+    receive: ASGIReceiveCallable,
+    send: ASGISendCallable,
+    timeout: float,
+) -> None:
+    """
+    Invoke an ASGI application bounded by `timeout` seconds, logging a warning if it expires.
+    
+    Lifespan scopes are not bounded: they stay open for the server's whole lifetime.
+    
+    Raises:
+        asyncio.TimeoutError: If `app` does not complete within `timeout` seconds.
+    """
+    if scope.get("type") == "lifespan":
+        await app(scope, receive, send)
+        return
+    try:
+        async with asyncio.timeout(timeout):
+            await app(scope, receive, send)
+    except asyncio.TimeoutError:
+        _logger.warning(
+            "ASGI call timed out after %s seconds (scope type=%s)",
+            timeout,
+            scope.get("type", "?"),
+        )
+        raise
 
 
 async def _dispatch(
@@ -299,6 +588,8 @@ async def _dispatch(
     """
     Dispatches an incoming ASGI connection to either the Socket.IO ASGI app or the FastAPI app, applying an optional timeout and optional Socket.IO-to-FastAPI fallback.
     
+    Kept for compatibility: `asyncplus` no longer calls this per request and instead builds a dispatch body specialised for its timeout and fallback settings.
+    
     If `route` is "socketio", the Socket.IO ASGI app is invoked; if it completes successfully the function returns. If the Socket.IO invocation raises an exception and `socketio_fallback_on_error` is True, the FastAPI app is invoked and the function returns; otherwise the original exception is re-raised. When `timeout` is set to a positive number, the selected ASGI invocation is bounded by that timeout; on timeout an asyncio.TimeoutError is raised after logging a warning.
     
     Parameters:
@@ -315,65 +606,359 @@ async def _dispatch(
         None
     """
 
-    async def run_socketio() -> None:
+    if timeout is not None and timeout <= 0:
+        timeout = None
+    if route != "socketio":
+        if timeout is None:
+            await fastapi_app(scope, receive, send)
+        else:
+            await _call_with_timeout(fastapi_app, scope, receive, send, timeout)
+        return
+    try:
+        if timeout is None:
+            await socketio_asgi(scope, receive, send)
+        else:
+            await _call_with_timeout(socketio_asgi, scope, receive, send, timeout)
+    except asyncio.TimeoutError:
+        raise
+    except Exception as exc:
+        if not socketio_fallback_on_error:
+            _logger.warning(
+                "Socket.IO rejected connection: %s", exc, exc_info=True
+            )
+            raise
+        if _logger.isEnabledFor(logging.INFO):
+            _logger.info(
+                "Socket.IO connection failed, falling back to FastAPI: %s",
+                exc,
+            )
+        if timeout is None:
+            await fastapi_app(scope, receive, send)
+        else:
+            await _call_with_timeout(fastapi_app, scope, receive, send, timeout)
+
+
+class _Breaker:
+    """
+    Consecutive-failure circuit breaker for the Socket.IO app, used with `socketio_fallback_on_error`.
+    
+    Closed: every request tries Socket.IO. After `threshold` consecutive failures (exceptions or
+    timeouts) it opens and requests go straight to FastAPI. Once `reset_timeout` seconds have passed,
+    one trial request is let through (half-open): success closes the breaker, failure reopens it for
+    another `reset_timeout`.
+    
+    Every admitted call is stamped with the current generation, which moves on whenever the breaker
+    opens. Outcomes reported with an older generation (e.g. a long-lived connection accepted before the
+    trip and ending after it) are ignored, so only trials admitted since the breaker last opened can close
+    or reopen it. A trial that outlives `reset_timeout` (such as a WebSocket session) still counts when it
+    ends, even if later trials have been admitted meanwhile.
+    """
+
+    __slots__ = ("threshold", "reset_timeout", "failures", "opened_at", "state", "generation")
+
+    def __init__(self, threshold: int, reset_timeout: float) -> None:
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self.state = "closed"
+        self.generation = 0
+
+    def allow(self) -> int | None:
         """
-        Invoke the Socket.IO ASGI application using the current ASGI scope and I/O callables.
+        Admit the next request to the Socket.IO app.
         
-        Await the Socket.IO application's completion before returning.
+        Returns:
+            int | None: The generation to report the outcome with, or None if the request should go to FastAPI.
         """
-        await socketio_asgi(scope, receive, send)
+        if self.state == "closed":
+            return self.generation
+        now = time.monotonic()
+        if now - self.opened_at < self.reset_timeout:
+            return None
+        # Let one trial through; moving opened_at keeps the others on FastAPI meanwhile, and
+        # retries after another reset_timeout if the trial never reports back (e.g. cancelled).
+        self.state = "half_open"
+        self.opened_at = now
+        return self.generation
 
-    async def run_fastapi() -> None:
+    def record_success(self, generation: int) -> None:
         """
-        Invoke the FastAPI ASGI application with the current ASGI scope and I/O callables.
+        Close the breaker and clear the failure count, unless `generation` is stale.
         """
-        await fastapi_app(scope, receive, send)
+        if generation != self.generation:
+            return
+        self.failures = 0
+        self.state = "closed"
 
-    async def run_with_timeout(coro) -> None:
+    def record_failure(self, generation: int) -> None:
         """
-        Execute the given coroutine honoring the outer `timeout` configuration.
+        Count a failure, opening the breaker at the threshold or when a half-open trial fails.
         
-        Parameters:
-            coro: The awaitable to run.
-        
-        Returns:
-            None
-        
-        Raises:
-            asyncio.TimeoutError: If `timeout` is set to a value greater than zero and the coroutine does not complete within that many seconds.
+        Failures reported with a stale `generation` are ignored.
         """
-        if timeout is not None and timeout > 0:
+        if generation != self.generation:
+            return
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.threshold:
+            if self.state == "closed":
+                _logger.warning(
+                    "Socket.IO failed %d times in a row; sending its requests to FastAPI for %s seconds",
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self.state = "open"
+            self.opened_at = time.monotonic()
+            self.generation += 1
+
+
+def _assemble(
+    fastapi_app: ASGI3Application,
+    socketio_asgi: ASGI3Application,
+    socketio_path: str,
+    *,
+    debug_hook: DebugHook | None,
+    socketio_fallback_on_error: bool,
+    timeout: float | None,
+    breaker: _Breaker | None = None,
+) -> ASGI3Application:
+    """
+    Build the composed ASGI app from already-prepared parts, specialised for the fallback and timeout settings.
+    
+    Parameters:
+        fastapi_app (ASGI3Application): Application for HTTP and lifespan requests.
+        socketio_asgi (ASGI3Application): Socket.IO ASGI application (already wrapped by `_to_asgi_app`).
+        socketio_path (str): Normalized Socket.IO base path (see `_normalize_socketio_path`).
+        debug_hook (DebugHook | None): Optional callback invoked with each routing decision.
+        socketio_fallback_on_error (bool): If True, fall back to FastAPI when the Socket.IO app raises.
+        timeout (float | None): Per-call timeout in seconds; None or non-positive disables it.
+        breaker (_Breaker | None): Circuit breaker consulted before calling Socket.IO; only used with fallback.
+    
+    Returns:
+        ASGI3Application: The ASGI application returned by `asyncplus`.
+    """
+    if timeout is not None and timeout <= 0:
+        timeout = None
+
+    # Configuration is fixed for the app's lifetime, so pick the matching
+    # dispatch body once instead of branching on it per request.
+    if debug_hook is None and timeout is None and not socketio_fallback_on_error:
+        # Default configuration: the routing decision is inlined (same rules as
+        # _make_router) so a request costs one coroutine frame and no router call.
+        base, base_slash = _socketio_path_bounds(socketio_path)
+        base_len = len(base)
+
+        async def asgi_app(
+            scope: Scope,
+            receive: ASGIReceiveCallable,
+            send: ASGISendCallable,
+        ) -> None:
+            """
+            Route an incoming ASGI connection to either the configured FastAPI app or the Socket.IO ASGI app based on the provided scope and module configuration.
+            
+            Parameters:
+                scope (Scope): ASGI connection scope dictionary.
+                receive (ASGIReceiveCallable): ASGI receive callable.
+                send (ASGISendCallable): ASGI send callable.
+            
+            Raises:
+                TypeError: If `scope` cannot be indexed by key (e.g. None or a list).
+            """
             try:
-                await asyncio.wait_for(coro, timeout=timeout)
+                scope_type = scope["type"]
+            except KeyError:
+                scope_type = "http"
+            except TypeError:
+                _require_dict_scope(scope)
+                raise
+            try:
+                routed_by_path = scope_type in _PATH_ROUTED_SCOPE_TYPES
+            except TypeError:  # unhashable, so not a string: treated as "http"
+                routed_by_path = True
+            if routed_by_path or not isinstance(scope_type, str):
+                try:
+                    path = scope["path"]
+                except KeyError:
+                    path = ""
+                if (type(path) is str or isinstance(path, str)) and (
+                    path.startswith(base_slash)
+                    if len(path) > base_len
+                    else path == base
+                ):
+                    try:
+                        await socketio_asgi(scope, receive, send)
+                    except asyncio.TimeoutError:
+                        raise
+                    except Exception as exc:
+                        _logger.warning(
+                            "Socket.IO rejected connection: %s", exc, exc_info=True
+                        )
+                        raise
+                    return
+            await fastapi_app(scope, receive, send)
+
+        return asgi_app
+
+    route_scope = _make_router(socketio_path)
+    if debug_hook is not None:
+        route_scope = _with_debug_hook(route_scope, debug_hook)
+
+    if timeout is None and not socketio_fallback_on_error:
+
+        async def asgi_app(
+            scope: Scope,
+            receive: ASGIReceiveCallable,
+            send: ASGISendCallable,
+        ) -> None:
+            """
+            Route an incoming ASGI connection to either the configured FastAPI app or the Socket.IO ASGI app based on the provided scope and module configuration.
+            
+            Parameters:
+                scope (Scope): ASGI connection scope dictionary.
+                receive (ASGIReceiveCallable): ASGI receive callable.
+                send (ASGISendCallable): ASGI send callable.
+            
+            Raises:
+                TypeError: If `scope` cannot be indexed by key (e.g. None or a list).
+            """
+            try:
+                route = route_scope(scope)
+            except TypeError:
+                _require_dict_scope(scope)
+                raise
+            if route == "fastapi":
+                await fastapi_app(scope, receive, send)
+                return
+            try:
+                await socketio_asgi(scope, receive, send)
             except asyncio.TimeoutError:
+                raise
+            except Exception as exc:
                 _logger.warning(
-                    "ASGI call timed out after %s seconds (scope type=%s)",
-                    timeout,
-                    scope.get("type", "?"),
+                    "Socket.IO rejected connection: %s", exc, exc_info=True
                 )
                 raise
-        else:
-            await coro
 
-    if route == "socketio":
-        try:
-            await run_with_timeout(run_socketio())
-        except asyncio.TimeoutError:
-            raise
-        except Exception as exc:
-            if socketio_fallback_on_error:
-                _logger.info(
-                    "Socket.IO connection failed, falling back to FastAPI: %s",
-                    exc,
-                )
-                await run_with_timeout(run_fastapi())
+    elif timeout is None:
+
+        async def asgi_app(
+            scope: Scope,
+            receive: ASGIReceiveCallable,
+            send: ASGISendCallable,
+        ) -> None:
+            """
+            Route like the default variant, handing the request to FastAPI if the Socket.IO app raises.
+            
+            Raises:
+                TypeError: If `scope` cannot be indexed by key (e.g. None or a list).
+            """
+            try:
+                route = route_scope(scope)
+            except TypeError:
+                _require_dict_scope(scope)
+                raise
+            generation = (
+                breaker.allow() if breaker is not None and route != "fastapi" else 0
+            )
+            if route == "fastapi" or generation is None:
+                await fastapi_app(scope, receive, send)
                 return
-            _logger.warning(
-                "Socket.IO rejected connection: %s", exc, exc_info=True
+            try:
+                await socketio_asgi(scope, receive, send)
+            except asyncio.TimeoutError:
+                if breaker is not None:
+                    breaker.record_failure(generation)
+                raise
+            except Exception as exc:
+                if breaker is not None:
+                    breaker.record_failure(generation)
+                if _logger.isEnabledFor(logging.INFO):
+                    _logger.info(
+                        "Socket.IO connection failed, falling back to FastAPI: %s",
+                        exc,
+                    )
+                await fastapi_app(scope, receive, send)
+            else:
+                if breaker is not None:
+                    breaker.record_success(generation)
+
+    elif not socketio_fallback_on_error:
+
+        async def asgi_app(
+            scope: Scope,
+            receive: ASGIReceiveCallable,
+            send: ASGISendCallable,
+        ) -> None:
+            """
+            Route like the default variant, bounding the selected app by the configured timeout.
+            
+            Raises:
+                TypeError: If `scope` cannot be indexed by key (e.g. None or a list).
+                asyncio.TimeoutError: If the selected app does not finish within `timeout` seconds.
+            """
+            try:
+                route = route_scope(scope)
+            except TypeError:
+                _require_dict_scope(scope)
+                raise
+            if route == "fastapi":
+                await _call_with_timeout(fastapi_app, scope, receive, send, timeout)
+                return
+            try:
+                await _call_with_timeout(socketio_asgi, scope, receive, send, timeout)
+            except asyncio.TimeoutError:
+                raise
+            except Exception as exc:
+                _logger.warning(
+                    "Socket.IO rejected connection: %s", exc, exc_info=True
+                )
+                raise
+
+    else:
+
+        async def asgi_app(
+            scope: Scope,
+            receive: ASGIReceiveCallable,
+            send: ASGISendCallable,
+        ) -> None:
+            """
+            Route with both the configured timeout and the Socket.IO-to-FastAPI fallback applied.
+            
+            Raises:
+                TypeError: If `scope` cannot be indexed by key (e.g. None or a list).
+                asyncio.TimeoutError: If the selected app does not finish within `timeout` seconds.
+            """
+            try:
+                route = route_scope(scope)
+            except TypeError:
+                _require_dict_scope(scope)
+                raise
+            generation = (
+                breaker.allow() if breaker is not None and route != "fastapi" else 0
             )
-            raise
-        return
-    await run_with_timeout(run_fastapi())
+            if route == "fastapi" or generation is None:
+                await _call_with_timeout(fastapi_app, scope, receive, send, timeout)
+                return
+            try:
+                await _call_with_timeout(socketio_asgi, scope, receive, send, timeout)
+            except asyncio.TimeoutError:
+                if breaker is not None:
+                    breaker.record_failure(generation)
+                raise
+            except Exception as exc:
+                if breaker is not None:
+                    breaker.record_failure(generation)
+                if _logger.isEnabledFor(logging.INFO):
+                    _logger.info(
+                        "Socket.IO connection failed, falling back to FastAPI: %s",
+                        exc,
+                    )
+                await _call_with_timeout(fastapi_app, scope, receive, send, timeout)
+            else:
+                if breaker is not None:
+                    breaker.record_success(generation)
+
+    return asgi_app
 
 
 @overload
@@ -403,6 +988,8 @@ def asyncplus(
     debug_hook: DebugHook | None = None,
     socketio_fallback_on_error: bool = False,
     timeout: float | None = None,
+    socketio_failure_threshold: int | None = None,
+    socketio_reset_timeout: float = 30.0,
 ) -> ASGI3Application:
     """
     Compose a single ASGI application that routes requests between a FastAPI app and a Socket.IO AsyncServer.
@@ -414,6 +1001,8 @@ def asyncplus(
         debug_hook (DebugHook | None): Optional callback invoked with the chosen route and request scope for debugging.
         socketio_fallback_on_error (bool): If True, fall back to the FastAPI app when handling via Socket.IO raises an exception.
         timeout (float | None): Optional per-request timeout in seconds applied to the delegated app; if None, no timeout is enforced.
+        socketio_failure_threshold (int | None): With fallback enabled, stop calling Socket.IO after this many consecutive failures (exceptions or timeouts).
+        socketio_reset_timeout (float): Seconds before a tripped breaker lets one trial request through to Socket.IO again.
 
     Returns:
         ASGI3Application: An ASGI application that inspects each scope, chooses the appropriate backend ("socketio" or "fastapi"), optionally invokes the debug_hook, and dispatches the request to the selected app with the configured fallback and timeout behavior.
@@ -425,10 +1014,12 @@ def asyncplus(
     fastapi_app: FastAPI,
     socketio_app: AsyncServer | ASGIApp,
     *,
-    socketio_path: str = "/socket.io/",
+    socketio_path: str = _DEFAULT_SOCKETIO_PATH,
     debug_hook: DebugHook | None = None,
     socketio_fallback_on_error: bool = False,
     timeout: float | None = None,  # seconds; None = no timeout
+    socketio_failure_threshold: int | None = None,
+    socketio_reset_timeout: float = 30.0,
 ) -> ASGI3Application:
     """
     Compose a FastAPI application and a Socket.IO application into a single ASGI app that routes requests to the appropriate backend.
@@ -438,49 +1029,37 @@ def asyncplus(
         debug_hook (DebugHook | None): Optional callback invoked with the chosen route and ASGI scope for each request.
         socketio_fallback_on_error (bool): If true, a runtime error while dispatching to the Socket.IO app will cause the request to be retried against the FastAPI app.
         timeout (float | None): Per-request timeout in seconds for dispatching to the selected app; `None` disables timeouts.
+        socketio_failure_threshold (int | None): Circuit breaker for the fallback: after this many consecutive Socket.IO failures (exceptions or timeouts), Socket.IO requests go straight to FastAPI. `None` (default) disables it; requires `socketio_fallback_on_error=True`.
+        socketio_reset_timeout (float): Seconds the breaker stays open before one trial request is sent to Socket.IO again.
     
     Raises:
-        ValueError: If `socketio_path` contains invalid characters.
-        TypeError: If an ASGI scope that is not a dict is passed to the returned application.
+        ValueError: If `socketio_path` contains invalid characters, or the breaker settings are invalid (threshold below 1, non-positive reset timeout, or a threshold without `socketio_fallback_on_error`).
+        TypeError: If the returned application is passed a scope that cannot be indexed by key (e.g. None or a list).
+            Other non-dict mappings are not rejected; they are routed like a dict.
     
     Returns:
         ASGI3Application: An ASGI application that inspects each scope, chooses between the Socket.IO and FastAPI handlers, optionally invokes `debug_hook`, and dispatches with the configured fallback and timeout behavior.
     """
-    socketio_asgi = _to_asgi_app(socketio_app)
-    normalized_socketio_path = _normalize_socketio_path(socketio_path)
-
-    async def asgi_app(
-        scope: Scope,
-        receive: ASGIReceiveCallable,
-        send: ASGISendCallable,
-    ) -> None:
-        """
-        Route an incoming ASGI connection to either the configured FastAPI app or the Socket.IO ASGI app based on the provided scope and module configuration.
-        
-        Parameters:
-            scope (Scope): ASGI connection scope dictionary.
-            receive (ASGIReceiveCallable): ASGI receive callable.
-            send (ASGISendCallable): ASGI send callable.
-        
-        Raises:
-            TypeError: If `scope` is not a dict.
-        """
-        if not isinstance(scope, dict):
-            raise TypeError(
-                f"ASGI scope must be dict, got {type(scope).__name__}"
+    # Validate the cheap arguments first, before wrapping the Socket.IO app.
+    socketio_path = _normalize_socketio_path(socketio_path)
+    breaker = None
+    if socketio_failure_threshold is not None:
+        if not socketio_fallback_on_error:
+            raise ValueError(
+                "socketio_failure_threshold requires socketio_fallback_on_error=True"
             )
-        route = _route(scope, normalized_socketio_path)
-        if debug_hook is not None:
-            debug_hook(route, scope)
-        await _dispatch(
-            route,
-            scope,
-            receive,
-            send,
-            socketio_asgi,
-            fastapi_app,
-            socketio_fallback_on_error=socketio_fallback_on_error,
-            timeout=timeout,
-        )
-
-    return asgi_app
\ No newline at end of file
+        if socketio_failure_threshold < 1 or socketio_reset_timeout <= 0:
+            raise ValueError(
+                "socketio_failure_threshold must be >= 1 and socketio_reset_timeout > 0 "
+                f"(got: {socketio_failure_threshold!r}, {socketio_reset_timeout!r})"
+            )
+        breaker = _Breaker(socketio_failure_threshold, socketio_reset_timeout)
+    return _assemble(
+        fastapi_app,
+        _to_asgi_app(socketio_app),
+        socketio_path,
+        debug_hook=debug_hook,
+        socketio_fallback_on_error=socketio_fallback_on_error,
+        timeout=timeout,
+        breaker=breaker,
+    )
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+# Copyright (c) 2026 Akshat kotpalliwar (alias IntegerAlex)
+
+"""Shared pytest fixtures for the asyncutilsx test suite."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from fastapi import FastAPI
+from socketio.async_server import AsyncServer
+
+from asyncutilsx import asyncplus
+
+
+@pytest.fixture(scope="module")
+def _combined_default():
+    """Build one default-configuration asyncplus app over mock backends per test module."""
+    fastapi_app = AsyncMock()
+    sio_app = AsyncMock()
+    return asyncplus(fastapi_app, sio_app), fastapi_app, sio_app
+
+
+@pytest.fixture
+def combined(_combined_default):
+    """
+    Default asyncplus app with its mock backends, as `(app, fastapi_app, sio_app)`.
+
+    The app is built once per module; the mocks' call records are cleared before each test.
+    """
+    _, fastapi_app, sio_app = _combined_default
+    fastapi_app.reset_mock()
+    sio_app.reset_mock()
+    return _combined_default
+
+
+@pytest.fixture(scope="session")
+def fastapi_instance():
+    """A real FastAPI app for tests that only pass it to asyncplus() and never mutate it."""
+    return FastAPI()
+
+
+@pytest.fixture(scope="session")
+def sio_server():
+    """A python-socketio AsyncServer shared by tests that only wrap or compose it."""
+    return AsyncServer(async_mode="asgi")
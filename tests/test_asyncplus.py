@@ -7,6 +7,7 @@ Production-grade: spec-compliant ASGI behavior with clear routing,
 explicit typing, and fail-fast validation for invalid scopes.
 """
 
+import asyncio
 import logging
 import pytest
 from unittest.mock import AsyncMock, MagicMock
@@ -18,7 +19,10 @@ from asyncutilsx import (
     asyncplus,
     create_app,
     health_check_route,
+    path_equals,
+    path_prefix,
     router,
+    _dispatch,
     _route,
     _to_asgi_app,
 )
@@ -155,6 +159,25 @@ class TestRoutePropertyBased:
         else:
             assert _route(scope, "/socket.io/") == "fastapi"
 
+    @given(
+        scope=_scope_dict,
+        socketio_path=st.sampled_from(["/socket.io/", "/custom/", "/a/"]),
+    )
+    @settings(max_examples=300)
+    def test_asyncplus_dispatch_agrees_with_route(self, scope, socketio_path):
+        # asyncplus inlines the routing rules in its default configuration.
+        chosen = []
+
+        async def fastapi_app(scope, receive, send):
+            chosen.append("fastapi")
+
+        async def sio_app(scope, receive, send):
+            chosen.append("socketio")
+
+        combined = asyncplus(fastapi_app, sio_app, socketio_path=socketio_path)
+        asyncio.run(combined(scope, AsyncMock(), AsyncMock()))
+        assert chosen == [_route(scope, socketio_path)]
+
     @given(
         path=st.sampled_from([
             "/", "/api", "/health", "/docs", "/openapi.json",
@@ -191,6 +214,12 @@ class TestToAsgiApp:
         r2 = _to_asgi_app(sio)
         assert isinstance(r1, ASGIApp) and isinstance(r2, ASGIApp)
 
+    def test_wrapper_reused_while_alive(self):
+        sio = AsyncServer(async_mode="asgi")
+        r1 = _to_asgi_app(sio)
+        assert _to_asgi_app(sio) is r1
+        assert _to_asgi_app(AsyncServer(async_mode="asgi")) is not r1
+
 
 # --- asyncplus() factory and returned ASGI app -------------------------------
 
@@ -406,6 +435,148 @@ class TestAsyncplus:
             for record in caplog.records
         )
 
+    @pytest.mark.asyncio
+    async def test_failure_threshold_opens_and_half_opens_breaker(self):
+        fastapi_app = AsyncMock()
+        sio_asgi = AsyncMock(side_effect=RuntimeError("reject"))
+        combined = asyncplus(
+            fastapi_app,
+            sio_asgi,
+            socketio_fallback_on_error=True,
+            socketio_failure_threshold=2,
+            socketio_reset_timeout=0.05,
+        )
+        scope = {"type": "websocket", "path": "/socket.io/"}
+        receive = AsyncMock()
+        send = AsyncMock()
+        for _ in range(3):
+            await combined(scope, receive, send)
+        # Open after two failures: the third request skips Socket.IO.
+        assert sio_asgi.call_count == 2
+        assert fastapi_app.call_count == 3
+
+        await asyncio.sleep(0.06)
+        sio_asgi.side_effect = None
+        await combined(scope, receive, send)
+        await combined(scope, receive, send)
+        # Half-open trial succeeded, so the breaker closed again.
+        assert sio_asgi.call_count == 4
+        assert fastapi_app.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_connection_admitted_before_trip_does_not_close_breaker(self):
+        released = asyncio.Event()
+
+        async def long_lived(scope, receive, send):
+            await released.wait()
+
+        fastapi_app = AsyncMock()
+        sio_asgi = AsyncMock(side_effect=long_lived)
+        combined = asyncplus(
+            fastapi_app,
+            sio_asgi,
+            socketio_fallback_on_error=True,
+            socketio_failure_threshold=2,
+            socketio_reset_timeout=60,
+        )
+        scope = {"type": "websocket", "path": "/socket.io/"}
+        receive = AsyncMock()
+        send = AsyncMock()
+        connection = asyncio.ensure_future(combined(scope, receive, send))
+        await asyncio.sleep(0)
+
+        sio_asgi.side_effect = RuntimeError("reject")
+        await combined(scope, receive, send)
+        await combined(scope, receive, send)
+        released.set()
+        await connection
+        # The connection ended cleanly after the trip; the breaker must stay open.
+        await combined(scope, receive, send)
+        assert sio_asgi.call_count == 3
+        assert fastapi_app.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_trial_outliving_reset_timeout_closes_breaker(self):
+        sessions = []
+
+        async def long_session(scope, receive, send):
+            ended = asyncio.Event()
+            sessions.append(ended)
+            await ended.wait()
+
+        fastapi_app = AsyncMock()
+        sio_asgi = AsyncMock(side_effect=RuntimeError("reject"))
+        combined = asyncplus(
+            fastapi_app,
+            sio_asgi,
+            socketio_fallback_on_error=True,
+            socketio_failure_threshold=2,
+            socketio_reset_timeout=0.02,
+        )
+        scope = {"type": "websocket", "path": "/socket.io/"}
+        receive = AsyncMock()
+        send = AsyncMock()
+        await combined(scope, receive, send)
+        await combined(scope, receive, send)
+
+        # Socket.IO recovered, but its sessions outlive reset_timeout: a second trial is
+        # admitted while the first is still open.
+        sio_asgi.side_effect = long_session
+        await asyncio.sleep(0.03)
+        first_trial = asyncio.ensure_future(combined(scope, receive, send))
+        await asyncio.sleep(0.03)
+        second_trial = asyncio.ensure_future(combined(scope, receive, send))
+        await asyncio.sleep(0)
+        sessions[0].set()
+        await first_trial
+
+        # The first trial's success closed the breaker.
+        third = asyncio.ensure_future(combined(scope, receive, send))
+        await asyncio.sleep(0)
+        assert sio_asgi.call_count == 5
+        assert fastapi_app.call_count == 2
+        for ended in sessions:
+            ended.set()
+        await asyncio.gather(second_trial, third)
+
+    @pytest.mark.asyncio
+    async def test_timeout_counts_as_breaker_failure(self):
+        async def hanging_app(scope, receive, send):
+            await asyncio.Future()
+
+        fastapi_app = AsyncMock()
+        sio_asgi = AsyncMock(side_effect=hanging_app)
+        combined = asyncplus(
+            fastapi_app,
+            sio_asgi,
+            socketio_fallback_on_error=True,
+            timeout=0.01,
+            socketio_failure_threshold=1,
+        )
+        scope = {"type": "websocket", "path": "/socket.io/"}
+        receive = AsyncMock()
+        send = AsyncMock()
+        with pytest.raises(asyncio.TimeoutError):
+            await combined(scope, receive, send)
+        await combined(scope, receive, send)
+        assert sio_asgi.call_count == 1
+        fastapi_app.assert_called_once()
+
+    def test_failure_threshold_validated(self):
+        with pytest.raises(ValueError, match="socketio_fallback_on_error"):
+            asyncplus(FastAPI(), AsyncMock(), socketio_failure_threshold=3)
+        with pytest.raises(ValueError, match="socketio_failure_threshold"):
+            asyncplus(
+                FastAPI(), AsyncMock(),
+                socketio_fallback_on_error=True, socketio_failure_threshold=0,
+            )
+        with pytest.raises(ValueError, match="socketio_reset_timeout"):
+            asyncplus(
+                FastAPI(), AsyncMock(),
+                socketio_fallback_on_error=True, socketio_failure_threshold=3,
+                socketio_reset_timeout=0,
+            )
+
     @pytest.mark.asyncio
     async def test_timeout_raises_timeout_error_when_app_hangs(self):
         import asyncio
@@ -430,6 +601,22 @@ class TestAsyncplus:
                 timeout=0.5,
             )
 
+    @pytest.mark.asyncio
+    async def test_timeout_not_applied_to_lifespan(self):
+        import asyncio
+
+        async def lifespan_app(scope, receive, send):
+            await asyncio.sleep(0.1)
+
+        fastapi_app = MagicMock()
+        fastapi_app.side_effect = lifespan_app
+        combined = asyncplus(fastapi_app, AsyncMock(), timeout=0.01)
+        scope = {"type": "lifespan"}
+        receive = AsyncMock(return_value={"type": "lifespan.startup"})
+        send = AsyncMock()
+        await combined(scope, receive, send)
+        fastapi_app.assert_called_once_with(scope, receive, send)
+
     @pytest.mark.asyncio
     async def test_accepts_asgi_app_as_socketio_arg(self):
         """
@@ -444,6 +631,35 @@ class TestAsyncplus:
         await combined(scope, receive, send)
 
 
+# --- _dispatch() (compatibility shim) -----------------------------------------
+
+
+class TestDispatch:
+    @pytest.mark.asyncio
+    async def test_routes_and_falls_back_without_nested_coroutines(self):
+        fastapi_app = AsyncMock()
+        sio_asgi = AsyncMock(side_effect=RuntimeError("reject"))
+        scope = {"type": "http", "path": "/socket.io/"}
+        receive = AsyncMock()
+        send = AsyncMock()
+        await _dispatch(
+            "socketio", scope, receive, send, sio_asgi, fastapi_app,
+            socketio_fallback_on_error=True, timeout=1.0,
+        )
+        sio_asgi.assert_called_once_with(scope, receive, send)
+        fastapi_app.assert_called_once_with(scope, receive, send)
+        with pytest.raises(RuntimeError):
+            await _dispatch(
+                "socketio", scope, receive, send, sio_asgi, fastapi_app,
+                socketio_fallback_on_error=False,
+            )
+        await _dispatch(
+            "fastapi", scope, receive, send, sio_asgi, fastapi_app,
+            socketio_fallback_on_error=False, timeout=0,
+        )
+        assert fastapi_app.call_count == 2
+
+
 # --- health_check_route() -----------------------------------------------------
 
 
@@ -460,7 +676,7 @@ class TestHealthCheckRoute:
         send.assert_any_call({
             "type": "http.response.start",
             "status": 200,
-            "headers": [[b"content-type", b"text/plain"]],
+            "headers": [[b"content-type", b"text/plain"], [b"content-length", b"2"]],
         })
         send.assert_any_call({
             "type": "http.response.body",
@@ -498,4 +714,100 @@ class TestRouter:
         receive = AsyncMock(return_value={"type": "http.request"})
         send = AsyncMock()
         with pytest.raises(RuntimeError):
-            await app(scope, receive, send)
\ No newline at end of file
+            await app(scope, receive, send)
+
+    def test_no_routes_returns_default_app(self):
+        default_app = AsyncMock()
+        assert router([], default_app=default_app) is default_app
+        typed = router([], default_app=default_app, type_routes={"websocket": AsyncMock()})
+        assert typed is not default_app
+
+    @pytest.mark.asyncio
+    async def test_path_predicates_keep_first_match_order(self):
+        generic_app = AsyncMock()
+        health_app = AsyncMock()
+        api_app = AsyncMock()
+        default_app = AsyncMock()
+        routes = [
+            (path_equals("/health"), health_app),
+            (lambda s: s.get("path") == "/api/special", generic_app),
+            (path_prefix("/api/"), api_app),
+        ]
+        app = router(routes, default_app=default_app)
+        receive = AsyncMock(return_value={"type": "http.request"})
+        send = AsyncMock()
+
+        await app({"type": "http", "path": "/health"}, receive, send)
+        health_app.assert_called_once()
+
+        # Opaque predicate listed before the prefix still wins.
+        await app({"type": "http", "path": "/api/special"}, receive, send)
+        generic_app.assert_called_once()
+        api_app.assert_not_called()
+
+        await app({"type": "http", "path": "/api/users"}, receive, send)
+        api_app.assert_called_once()
+
+        await app({"type": "http", "path": "/healthz"}, receive, send)
+        await app({"type": "lifespan"}, receive, send)
+        assert default_app.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_scope_type_checked(self):
+        class ScopeDict(dict):
+            pass
+
+        default_app = AsyncMock()
+        app = router([(lambda s: False, AsyncMock())], default_app=default_app)
+        receive = AsyncMock()
+        send = AsyncMock()
+        with pytest.raises(TypeError, match="ASGI scope must be dict"):
+            await app(None, receive, send)
+        await app(ScopeDict(type="http", path="/"), receive, send)
+        default_app.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_type_routes_checked_before_predicates(self):
+        websocket_app = AsyncMock()
+        predicate_app = AsyncMock()
+        default_app = AsyncMock()
+        app = router(
+            [(lambda s: True, predicate_app)],
+            default_app=default_app,
+            type_routes={"websocket": websocket_app, "lifespan": default_app},
+        )
+        receive = AsyncMock()
+        send = AsyncMock()
+
+        ws_scope = {"type": "websocket", "path": "/"}
+        await app(ws_scope, receive, send)
+        websocket_app.assert_called_once_with(ws_scope, receive, send)
+
+        await app({"type": "lifespan"}, receive, send)
+        default_app.assert_called_once()
+
+        await app({"type": "http", "path": "/"}, receive, send)
+        await app({"type": ["http"], "path": "/"}, receive, send)
+        assert predicate_app.call_count == 2
+
+        with pytest.raises(TypeError, match="ASGI scope must be dict"):
+            await app(None, receive, send)
+
+
+# --- path_equals() / path_prefix() --------------------------------------------
+
+
+class TestPathPredicates:
+    def test_path_equals_matches_exact_path_only(self):
+        predicate = path_equals("/health")
+        assert predicate({"path": "/health"})
+        assert not predicate({"path": "/health/"})
+        assert not predicate({"path": None})
+        assert not predicate({})
+
+    def test_path_prefix_matches_subpaths(self):
+        predicate = path_prefix("/sse/")
+        assert predicate({"path": "/sse/"})
+        assert predicate({"path": "/sse/events"})
+        assert not predicate({"path": "/sse"})
+        assert not predicate({"path": 1})
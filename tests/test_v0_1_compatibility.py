@@ -19,121 +19,97 @@ Changes in v0.2.0:
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
-from fastapi import FastAPI
-from socketio.async_server import AsyncServer
 
 from asyncutilsx import asyncplus, create_app, _route, _to_asgi_app
 
+# Scopes shared by the asyncplus() tests; asyncplus never mutates a scope (see
+# test_scope_mutation_does_not_occur, which works on a copy).
+HTTP_API_SCOPE = {"type": "http", "path": "/api"}
+HTTP_ROOT_SCOPE = {"type": "http", "path": "/"}
+WS_SOCKETIO_SCOPE = {"type": "websocket", "path": "/socket.io/"}
+
+# (scope, socketio_path, expected route) for _route().
+ROUTE_CASES = [
+    # v0.1.0 behavior: HTTP requests not for /socket.io/ go to FastAPI.
+    pytest.param({"type": "http", "path": "/api"}, "/socket.io/", "fastapi", id="http-api"),
+    # v0.1.0 behavior: HTTP requests for /socket.io/ go to Socket.IO.
+    pytest.param({"type": "http", "path": "/socket.io/"}, "/socket.io/", "socketio", id="http-socketio"),
+    # v0.2.0 BREAKING CHANGE: WebSocket routes to Socket.IO only if the path matches
+    # socketio_path (v0.1.0 sent every WebSocket to Socket.IO). The asyncplus() app
+    # inlines this rule; test_asyncplus.py checks it agrees with _route for any scope.
+    pytest.param({"type": "websocket", "path": "/socket.io/"}, "/socket.io/", "socketio", id="ws-socketio"),
+    pytest.param({"type": "websocket", "path": "/other"}, "/socket.io/", "fastapi", id="ws-other"),
+    # Feature: custom socketio_path; the default path then goes to FastAPI.
+    pytest.param({"type": "http", "path": "/custom/"}, "/custom/", "socketio", id="custom-path"),
+    pytest.param({"type": "http", "path": "/socket.io/"}, "/custom/", "fastapi", id="custom-path-default"),
+]
+
+# (scope, expected route) for malformed scopes; None means any valid route will do.
+MALFORMED_SCOPES = [
+    pytest.param({"path": "/api"}, "fastapi", id="missing-type"),
+    pytest.param({"type": "http"}, "fastapi", id="missing-path"),
+    pytest.param({"type": "http", "path": None}, None, id="none-path"),
+    pytest.param({"type": "http", "path": 123}, None, id="int-path"),
+    pytest.param({"type": 123, "path": "/"}, None, id="int-type"),
+]
+
+
+async def noop_receive():
+    """ASGI receive for tests whose backends never read the request."""
+    return {"type": "http.disconnect"}
+
+
+async def noop_send(message):
+    """ASGI send for tests that do not inspect sent messages."""
+
+
+async def raising_sio_app(scope, receive, send):
+    """Socket.IO stand-in that rejects every connection."""
+    raise RuntimeError("test error")
+
 
 class TestV010CoreBehaviorPreserved:
     """Test that core v0.1.0 behavior is preserved in v0.2.0."""
 
-    def test_basic_routing_http_non_socketio_to_fastapi(self):
-        """v0.1.0 behavior: HTTP requests not for /socket.io/ go to FastAPI."""
-        scope = {"type": "http", "path": "/api"}
-        assert _route(scope, "/socket.io/") == "fastapi"
-
-    def test_basic_routing_http_socketio_to_socketio(self):
-        """v0.1.0 behavior: HTTP requests for /socket.io/ go to Socket.IO."""
-        scope = {"type": "http", "path": "/socket.io/"}
-        assert _route(scope, "/socket.io/") == "socketio"
-
-    def test_basic_routing_websocket_to_socketio(self):
-        """v0.2.0 BREAKING CHANGE: WebSocket now requires socketio_path match."""
-        # In v0.1.0: WebSocket always routed to socketio
-        # In v0.2.0: WebSocket ONLY routes to socketio if path matches socketio_path
-        scope = {"type": "websocket", "path": "/socket.io/"}
-        assert _route(scope, "/socket.io/") == "socketio"
-
-    def test_basic_routing_websocket_without_socketio_path(self):
-        """v0.2.0 BREAKING CHANGE: WebSocket without socketio_path routes to fastapi."""
-        # In v0.1.0: any WebSocket went to Socket.IO
-        # In v0.2.0: WebSocket without matching socketio_path goes to FastAPI
-        scope = {"type": "websocket", "path": "/other"}
-        assert _route(scope, "/socket.io/") == "fastapi"
-
-    def test_asyncplus_creates_callable_asgi_app(self):
+    @pytest.mark.parametrize("scope, socketio_path, expected", ROUTE_CASES)
+    def test_route(self, scope, socketio_path, expected):
+        """_route() sends each scope to the expected app (see ROUTE_CASES)."""
+        assert _route(scope, socketio_path) == expected
+
+    def test_asyncplus_creates_callable_asgi_app(self, fastapi_instance, sio_server):
         """v0.1.0 behavior: asyncplus() returns a callable ASGI app."""
-        app = FastAPI()
-        sio = AsyncServer(async_mode="asgi")
-        combined = asyncplus(app, sio)
+        combined = asyncplus(fastapi_instance, sio_server)
         assert callable(combined)
 
-    def test_asyncplus_accepts_async_server(self):
+    def test_asyncplus_accepts_async_server(self, fastapi_instance, sio_server):
         """v0.1.0 behavior: asyncplus() accepts AsyncServer directly."""
-        app = FastAPI()
-        sio = AsyncServer(async_mode="asgi")
-        combined = asyncplus(app, sio)
+        combined = asyncplus(fastapi_instance, sio_server)
         assert callable(combined)
 
-    @pytest.mark.asyncio
-    async def test_asyncplus_routes_http_to_fastapi(self):
+    async def test_asyncplus_routes_http_to_fastapi(self, combined):
         """v0.1.0 behavior: asyncplus() routes HTTP to FastAPI."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
-
-        scope = {"type": "http", "path": "/api"}
-        receive = AsyncMock()
-        send = AsyncMock()
+        app, fastapi_app, _ = combined
 
-        await combined(scope, receive, send)
+        await app(HTTP_API_SCOPE, noop_receive, noop_send)
         fastapi_app.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_asyncplus_routes_websocket_to_socketio(self):
-        """v0.2.0 BREAKING CHANGE: asyncplus() routes WebSocket to Socket.IO only if path matches."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
-
-        # v0.1.0 would have routed this to socket.io
-        # v0.2.0 requires path to match socketio_path
-        scope = {"type": "websocket", "path": "/socket.io/"}
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        await combined(scope, receive, send)
-        sio_app.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_asyncplus_routes_socketio_path_to_socketio(self):
-        """v0.1.0 behavior: asyncplus() routes /socket.io/ to Socket.IO."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
-
-        scope = {"type": "http", "path": "/socket.io/"}
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        await combined(scope, receive, send)
-        sio_app.assert_called_once()
-
 
 class TestV010BreakingChanges:
     """Document and test breaking changes from v0.1.0 to v0.2.0."""
 
-    @pytest.mark.asyncio
-    async def test_non_dict_scope_now_raises_type_error(self):
+    @pytest.mark.parametrize(
+        "bad_scope",
+        [None, [], "not a dict", 123],
+        ids=["none", "list", "str", "int"],
+    )
+    async def test_non_dict_scope_now_raises_type_error(self, combined, bad_scope):
         """BREAKING: v0.1.0 normalized None/non-dict scopes; v0.2.0 raises TypeError."""
         # v0.1.0 behavior: normalized to empty dict {}
         # v0.2.0 behavior: raises TypeError
-
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
-
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        # None scope should raise TypeError in v0.2.0
-        with pytest.raises(TypeError, match="ASGI scope must be dict"):
-            await combined(None, receive, send)
-
-        # Non-dict scope should raise TypeError in v0.2.0
+        app, fastapi_app, _ = combined
         with pytest.raises(TypeError, match="ASGI scope must be dict"):
-            await combined([], receive, send)
+            await app(bad_scope, noop_receive, noop_send)
+        fastapi_app.assert_not_called()
 
     def test_router_class_removed_use_function_instead(self):
         """BREAKING: RouterController class removed; replaced by router() function."""
@@ -156,97 +132,60 @@ class TestV010BreakingChanges:
 class TestV020ErrorHandling:
     """Test comprehensive error handling in v0.2.0."""
 
-    def test_error_on_invalid_socketio_path_with_spaces(self):
-        """Error handling: socketio_path with spaces raises ValueError."""
-        with pytest.raises(ValueError, match="invalid characters"):
-            asyncplus(FastAPI(), AsyncMock(), socketio_path="/custom space/")
-
-    def test_error_on_invalid_socketio_path_with_tabs(self):
-        """Error handling: socketio_path with tabs raises ValueError."""
-        with pytest.raises(ValueError, match="invalid characters"):
-            asyncplus(FastAPI(), AsyncMock(), socketio_path="/custom\t/")
-
-    def test_error_on_invalid_socketio_path_with_newlines(self):
-        """Error handling: socketio_path with newlines raises ValueError."""
+    @pytest.mark.parametrize(
+        "socketio_path",
+        [
+            pytest.param("/custom space/", id="space"),
+            pytest.param("/custom\t/", id="tab"),
+            pytest.param("/custom\n/", id="newline"),
+        ],
+    )
+    def test_error_on_invalid_socketio_path(self, socketio_path):
+        """Error handling: socketio_path with spaces, tabs or newlines raises ValueError."""
+        # Validation fails before either app is used, so plain mocks suffice.
         with pytest.raises(ValueError, match="invalid characters"):
-            asyncplus(FastAPI(), AsyncMock(), socketio_path="/custom\n/")
+            asyncplus(MagicMock(), AsyncMock(), socketio_path=socketio_path)
 
-    @pytest.mark.asyncio
     async def test_socket_io_error_logged_and_reraised_without_fallback(self):
         """Error handling: Socket.IO errors are logged when not falling back."""
         fastapi_app = AsyncMock()
-        sio_app = AsyncMock(side_effect=RuntimeError("test error"))
-        combined = asyncplus(fastapi_app, sio_app, socketio_fallback_on_error=False)
-
-        scope = {"type": "websocket", "path": "/socket.io/"}
-        receive = AsyncMock()
-        send = AsyncMock()
+        combined = asyncplus(
+            fastapi_app, raising_sio_app, socketio_fallback_on_error=False
+        )
 
         with pytest.raises(RuntimeError):
-            await combined(scope, receive, send)
+            await combined(WS_SOCKETIO_SCOPE, noop_receive, noop_send)
 
         fastapi_app.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_socket_io_error_falls_back_when_enabled(self):
         """Error handling: Socket.IO errors fall back to FastAPI when enabled."""
         fastapi_app = AsyncMock()
-        sio_app = AsyncMock(side_effect=RuntimeError("test error"))
         combined = asyncplus(
-            fastapi_app, sio_app, socketio_fallback_on_error=True
+            fastapi_app, raising_sio_app, socketio_fallback_on_error=True
         )
 
-        scope = {"type": "websocket", "path": "/"}
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        await combined(scope, receive, send)
+        # Must route to Socket.IO first for the fallback to be exercised.
+        await combined(WS_SOCKETIO_SCOPE, noop_receive, noop_send)
 
         fastapi_app.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_timeout_error_is_raised(self):
         """Error handling: Timeout errors are properly raised."""
         async def slow_app(scope, receive, send):
-            await asyncio.sleep(10)
+            await asyncio.sleep(0.1)
 
         fastapi_app = MagicMock()
         fastapi_app.side_effect = slow_app
         combined = asyncplus(fastapi_app, AsyncMock(), timeout=0.01)
 
-        scope = {"type": "http", "path": "/"}
-        receive = AsyncMock()
-        send = AsyncMock()
-
         with pytest.raises(asyncio.TimeoutError):
-            await asyncio.wait_for(combined(scope, receive, send), timeout=0.5)
-
-    @pytest.mark.asyncio
-    async def test_type_error_on_invalid_scope_type(self):
-        """Error handling: TypeError raised for invalid scope types."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
-
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        with pytest.raises(TypeError):
-            await combined("not a dict", receive, send)
-
-        fastapi_app.reset_mock()
-        with pytest.raises(TypeError):
-            await combined(123, receive, send)
-
-        fastapi_app.reset_mock()
-        with pytest.raises(TypeError):
-            await combined([], receive, send)
+            await combined(HTTP_ROOT_SCOPE, noop_receive, noop_send)
 
 
 class TestV020NewFeatures:
     """Test new features in v0.2.0 that enhance error handling."""
 
-    @pytest.mark.asyncio
     async def test_debug_hook_called_on_every_request(self):
         """Feature: debug_hook is called for every request."""
         debug_hook = MagicMock()
@@ -254,62 +193,37 @@ class TestV020NewFeatures:
         sio_app = AsyncMock()
         combined = asyncplus(fastapi_app, sio_app, debug_hook=debug_hook)
 
-        scope = {"type": "http", "path": "/"}
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        await combined(scope, receive, send)
+        await combined(HTTP_ROOT_SCOPE, noop_receive, noop_send)
 
         debug_hook.assert_called_once()
         call_args = debug_hook.call_args
         assert call_args[0][0] in ("socketio", "fastapi")
-        assert call_args[0][1] is scope
-
-    def test_custom_socketio_path_routing(self):
-        """Feature: custom socketio_path allows non-default paths."""
-        scope_custom = {"type": "http", "path": "/custom/"}
-        scope_default = {"type": "http", "path": "/socket.io/"}
+        assert call_args[0][1] is HTTP_ROOT_SCOPE
 
-        # With custom path
-        result = _route(scope_custom, "/custom/")
-        assert result == "socketio"
-
-        # Default path is treated as fastapi with custom routing
-        result = _route(scope_default, "/custom/")
-        assert result == "fastapi"
-
-    @pytest.mark.asyncio
     async def test_timeout_feature_completes_quickly(self):
         """Feature: Timeout allows terminating slow operations."""
         async def quick_app(scope, receive, send):
-            await asyncio.sleep(0.001)
+            return None
 
         fastapi_app = MagicMock()
         fastapi_app.side_effect = quick_app
         combined = asyncplus(fastapi_app, AsyncMock(), timeout=1.0)
 
-        scope = {"type": "http", "path": "/"}
-        receive = AsyncMock()
-        send = AsyncMock()
-
         # Should complete successfully within timeout
-        await combined(scope, receive, send)
+        await combined(HTTP_ROOT_SCOPE, noop_receive, noop_send)
 
 
 class TestV020CreateAppConvenience:
     """Test the create_app convenience function for common use case."""
 
-    def test_create_app_is_shorthand_for_asyncplus(self):
+    def test_create_app_is_shorthand_for_asyncplus(self, fastapi_instance, sio_server):
         """Feature: create_app() is a convenient shorthand."""
-        app = FastAPI()
-        sio = AsyncServer(async_mode="asgi")
-        combined1 = create_app(app, sio)
-        combined2 = asyncplus(app, sio)
+        combined1 = create_app(fastapi_instance, sio_server)
+        combined2 = asyncplus(fastapi_instance, sio_server)
 
         assert callable(combined1)
         assert callable(combined2)
 
-    @pytest.mark.asyncio
     async def test_create_app_routes_correctly(self):
         """Feature: create_app() routes like asyncplus()."""
         fastapi_app = AsyncMock()
@@ -318,108 +232,70 @@ class TestV020CreateAppConvenience:
         combined = create_app(fastapi_app, sio_app)
 
         # Test FastAPI routing
-        scope = {"type": "http", "path": "/api"}
-        receive = AsyncMock()
-        send = AsyncMock()
-        await combined(scope, receive, send)
+        await combined(HTTP_API_SCOPE, noop_receive, noop_send)
         fastapi_app.assert_called_once()
 
 
 class TestV020RobustErrorCoverage:
     """Ensure exceptional error handling (errors are handled properly)."""
 
-    @pytest.mark.asyncio
-    async def test_scope_mutation_does_not_occur(self):
+    async def test_scope_mutation_does_not_occur(self, combined):
         """Robustness: scope dict is not mutated by routing."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
+        app, _, _ = combined
 
-        original_scope = {"type": "http", "path": "/api"}
+        original_scope = dict(HTTP_API_SCOPE)
         scope_copy = dict(original_scope)
 
-        receive = AsyncMock()
-        send = AsyncMock()
-        await combined(original_scope, receive, send)
+        await app(original_scope, noop_receive, noop_send)
 
         assert original_scope == scope_copy
 
     def test_route_function_deterministic(self):
         """Robustness: _route() is deterministic."""
-        scope = {"type": "http", "path": "/api"}
-        result1 = _route(scope, "/socket.io/")
-        result2 = _route(scope, "/socket.io/")
+        result1 = _route(HTTP_API_SCOPE, "/socket.io/")
+        result2 = _route(HTTP_API_SCOPE, "/socket.io/")
         assert result1 == result2
 
-    def test_to_asgi_app_idempotent(self):
+    def test_to_asgi_app_idempotent(self, sio_server):
         """Robustness: _to_asgi_app() wrapping is idempotent."""
-        sio = AsyncServer(async_mode="asgi")
-        wrapped1 = _to_asgi_app(sio)
+        wrapped1 = _to_asgi_app(sio_server)
         wrapped2 = _to_asgi_app(wrapped1)
         assert wrapped1 is wrapped2
 
-    @pytest.mark.asyncio
-    async def test_null_receive_handled(self):
+    async def test_null_receive_handled(self, combined):
         """Robustness: Null receive is passed through to app."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
+        app, fastapi_app, _ = combined
 
-        scope = {"type": "http", "path": "/"}
         receive = AsyncMock(return_value={"type": "http.disconnect"})
         send = AsyncMock()
 
-        await combined(scope, receive, send)
+        await app(HTTP_ROOT_SCOPE, receive, send)
         fastapi_app.assert_called_once()
 
-    def test_empty_socketio_path_normalized(self):
+    def test_empty_socketio_path_normalized(self, fastapi_instance):
         """Robustness: empty socketio_path is normalized to /socket.io/."""
         # Creating app with empty path should not fail
-        combined = asyncplus(FastAPI(), AsyncMock(), socketio_path="")
+        combined = asyncplus(fastapi_instance, AsyncMock(), socketio_path="")
         assert callable(combined)
 
-    @pytest.mark.asyncio
-    async def test_scope_with_missing_type_routes_safely(self):
-        """Robustness: scope without 'type' key routes safely to fastapi."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
-
-        scope = {"path": "/api"}  # missing 'type' key
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        await combined(scope, receive, send)
-        fastapi_app.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_scope_with_missing_path_routes_safely(self):
-        """Robustness: scope without 'path' key routes safely."""
-        fastapi_app = AsyncMock()
-        sio_app = AsyncMock()
-        combined = asyncplus(fastapi_app, sio_app)
-
-        scope = {"type": "http"}  # missing 'path' key
-        receive = AsyncMock()
-        send = AsyncMock()
-
-        await combined(scope, receive, send)
-        fastapi_app.assert_called_once()
-
-    def test_route_handles_none_path(self):
-        """Robustness: _route() handles None path gracefully."""
-        scope = {"type": "http", "path": None}
+    @pytest.mark.parametrize("scope, expected", MALFORMED_SCOPES)
+    def test_route_handles_malformed_scopes(self, scope, expected):
+        """Robustness: _route() returns a valid route for missing keys and non-string values."""
         result = _route(scope, "/socket.io/")
-        assert result in ("socketio", "fastapi")
-
-    def test_route_handles_non_string_path(self):
-        """Robustness: _route() handles non-string path gracefully."""
-        scope = {"type": "http", "path": 123}
-        result = _route(scope, "/socket.io/")
-        assert result in ("socketio", "fastapi")
-
-    def test_route_handles_non_string_type(self):
-        """Robustness: _route() handles non-string type gracefully."""
-        scope = {"type": 123, "path": "/"}
-        result = _route(scope, "/socket.io/")
-        assert result in ("socketio", "fastapi")
+        if expected is None:
+            assert result in ("socketio", "fastapi")
+        else:
+            assert result == expected
+
+    @pytest.mark.parametrize(
+        "scope",
+        [
+            pytest.param({"path": "/api"}, id="missing-type"),
+            pytest.param({"type": "http"}, id="missing-path"),
+        ],
+    )
+    async def test_scope_with_missing_key_routes_to_fastapi(self, combined, scope):
+        """Robustness: the combined app sends scopes missing 'type' or 'path' to FastAPI."""
+        app, fastapi_app, _ = combined
+        await app(scope, noop_receive, noop_send)
+        fastapi_app.assert_called_once()